@@ -0,0 +1,167 @@
+"""
+Structure-of-arrays candle storage for the hot decision path.
+
+The strategies read only a handful of scalar tail values per tick, but a
+pandas DataFrame makes every column access pay hash lookup, BlockManager
+traversal and Series construction. Candles keeps the same OHLCV data as
+parallel ndarrays (close, high, low, ... plus int64 nanosecond
+timestamps) so a column read is a single attribute load and tail values
+are plain array indexing.
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _to_ns(timestamp) -> int:
+    """int64 nanoseconds since epoch from a datetime/Timestamp/datetime64."""
+    if isinstance(timestamp, (int, np.integer)):
+        return int(timestamp)
+    return int(pd.Timestamp(timestamp).value)
+
+
+def datetime_index_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    """
+    int64 nanoseconds since epoch for a DatetimeIndex, regardless of the
+    index's native resolution (under pandas 2+ even pd.date_range may
+    carry a us/ms unit, where .asi8 alone would break the nanosecond
+    contract of the session arithmetic).
+    """
+    if hasattr(index, 'as_unit'):
+        index = index.as_unit('ns')
+    return index.asi8
+
+
+class Candles:
+    """
+    Fixed-capacity buffer of completed OHLCV bars stored as parallel
+    ndarrays (structure-of-arrays).
+
+    Bars are appended in place; once the buffer is full the oldest bar
+    is evicted by sliding the arrays left one slot. That memmove happens
+    once per completed bar (seconds apart), while the arrays stay
+    contiguous so the per-tick readers get zero-copy views.
+
+    Timestamps are int64 nanoseconds since epoch, matching the integer
+    session arithmetic in strategies.py. Prices and volume are float32:
+    FX tick sizes (~1e-5) sit far above float32 resolution at O(1)
+    prices, and halving the bytes moved per window keeps the decision
+    path cache-friendly. SL/TP offsets handed to order placement are
+    still computed in float64.
+    """
+
+    __slots__ = ('capacity', 'has_volume', '_len',
+                 '_ts_ns', '_open', '_high', '_low', '_close', '_volume')
+
+    def __init__(self, capacity: int, has_volume: bool = True):
+        self.capacity = capacity
+        self.has_volume = has_volume
+        self._len = 0
+        self._ts_ns = np.empty(capacity, dtype=np.int64)
+        self._open = np.empty(capacity, dtype=np.float32)
+        self._high = np.empty(capacity, dtype=np.float32)
+        self._low = np.empty(capacity, dtype=np.float32)
+        self._close = np.empty(capacity, dtype=np.float32)
+        self._volume = np.zeros(capacity, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def n_bars(self) -> int:
+        """Number of completed bars; strategies compare this against
+        their precomputed minimum instead of len() on a DataFrame."""
+        return self._len
+
+    # Zero-copy views over the filled part of the buffer
+
+    @property
+    def ts_ns(self) -> np.ndarray:
+        return self._ts_ns[:self._len]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._open[:self._len]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._high[:self._len]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._low[:self._len]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._close[:self._len]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._volume[:self._len]
+
+    def append(self, timestamp, open_: float, high: float, low: float,
+               close: float, volume: float = 0.0) -> None:
+        """Append one completed bar, evicting the oldest when full."""
+        if self._len == self.capacity:
+            for arr in (self._ts_ns, self._open, self._high,
+                        self._low, self._close, self._volume):
+                arr[:-1] = arr[1:]
+            self._len -= 1
+        i = self._len
+        self._ts_ns[i] = _to_ns(timestamp)
+        self._open[i] = open_
+        self._high[i] = high
+        self._low[i] = low
+        self._close[i] = close
+        self._volume[i] = volume
+        self._len = i + 1
+
+    def clear(self) -> None:
+        self._len = 0
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Copy out as an OHLCV DataFrame (e.g. for pandas-ta seeding)."""
+        data = {
+            'timestamp': self.ts_ns.astype('datetime64[ns]'),
+            'open': self.open.copy(),
+            'high': self.high.copy(),
+            'low': self.low.copy(),
+            'close': self.close.copy(),
+        }
+        if self.has_volume:
+            data['volume'] = self.volume.copy()
+        return pd.DataFrame(data)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame,
+                       capacity: Optional[int] = None) -> "Candles":
+        """
+        Bulk-load from an OHLC DataFrame with a 'timestamp' column or a
+        DatetimeIndex. Used to rebuild the buffer after a history
+        backfill and as a fallback for callers that only have a frame.
+        """
+        n = len(df)
+        if 'timestamp' in df.columns:
+            ts = df['timestamp'].to_numpy()
+            if ts.dtype.kind == 'M':
+                # normalise to nanoseconds; newer pandas may hand back us/ms units
+                ns = ts.astype('datetime64[ns]', copy=False).view('i8')
+            else:
+                ns = np.array([_to_ns(t) for t in ts], dtype=np.int64)
+        elif isinstance(df.index, pd.DatetimeIndex):
+            ns = datetime_index_ns(df.index)
+        else:
+            raise ValueError("DataFrame needs a 'timestamp' column or a DatetimeIndex")
+
+        has_volume = 'volume' in df.columns
+        candles = cls(max(capacity or 0, n, 1), has_volume)
+        candles._ts_ns[:n] = ns
+        candles._open[:n] = df['open'].to_numpy(copy=False)
+        candles._high[:n] = df['high'].to_numpy(copy=False)
+        candles._low[:n] = df['low'].to_numpy(copy=False)
+        candles._close[:n] = df['close'].to_numpy(copy=False)
+        if has_volume:
+            candles._volume[:n] = df['volume'].to_numpy(copy=False)
+        candles._len = n
+        return candles
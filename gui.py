@@ -7,9 +7,10 @@ from typing import List # Added for type hinting
 import pandas as pd # Added for OHLC data handling
 from trading import Trader  # adjust import path if needed
 from strategies import (
-    SafeStrategy, ModerateStrategy, AggressiveStrategy,
+    Decision, SafeStrategy, ModerateStrategy, AggressiveStrategy,
     MomentumStrategy, MeanReversionStrategy
 )
+from indicators_cache import TickIndicators
 
 
 class MainApplication(tk.Tk):
@@ -548,6 +549,7 @@ class TradingPage(ttk.Frame):
 
     def _scalp_loop(self, symbol: str, tp: float, sl: float, size: float, strategy):
         """Background thread: pure logic, enqueues UI updates."""
+        decide = strategy.decide  # bind once; direct call in the hot loop
         while self.is_scalping:
             current_tick_price = self.trader.get_market_price(symbol) # Fetches latest tick price
 
@@ -567,20 +569,23 @@ class TradingPage(ttk.Frame):
             data_for_strategy = {
                 'ohlc_1m': ohlc_1m_df,
                 'ohlc_15s': ohlc_15s_df,
+                'candles_1m': self.trader.candles.get('1m'),
+                # Shared lazy indicator context for this tick's window
+                'indicators': TickIndicators(ohlc_1m_df),
                 'current_equity': current_equity,
                 'pip_position': pip_position_val, # For calculating pip value / SL-TP in pips
                 'current_price_tick': current_tick_price
             }
 
-            action_details = strategy.decide(data_for_strategy) # Expected to be a dict
+            decision = decide(data_for_strategy) # Expected to be a Decision
 
-            if action_details and isinstance(action_details, dict):
-                trade_action = action_details.get('action')
+            if isinstance(decision, Decision):
+                trade_action = decision.action
                 if trade_action in ("buy", "sell"):
                     # For now, pass the raw offsets. _execute_trade will eventually need to handle them.
-                    sl_offset = action_details.get('sl_offset')
-                    tp_offset = action_details.get('tp_offset')
-                    comment = action_details.get('comment', '')
+                    sl_offset = decision.sl_offset
+                    tp_offset = decision.tp_offset
+                    comment = decision.comment
 
                     self._ui_queue.put((self._log, (f"Strategy signal: {trade_action.upper()} for {symbol}. {comment}",)))
                     self._ui_queue.put((
@@ -589,10 +594,10 @@ class TradingPage(ttk.Frame):
                         (trade_action, symbol, current_tick_price, size, tp, sl, sl_offset, tp_offset, comment)
                     ))
                 else: # 'hold' or other non-trade action
-                    comment = action_details.get('comment', "Strategy returned HOLD or no action.")
+                    comment = decision.comment or "Strategy returned HOLD or no action."
                     self._ui_queue.put((self._log, (comment,)))
             else: # Strategy returned None or unexpected type
-                self._ui_queue.put((self._log, ("Strategy did not return a valid action dictionary.",)))
+                self._ui_queue.put((self._log, ("Strategy did not return a valid Decision.",)))
 
             time.sleep(1) # Consider making this configurable
 
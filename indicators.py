@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
@@ -22,6 +23,37 @@ def calculate_atr(ohlc_df: pd.DataFrame, length: int = 14) -> pd.Series:
     temp_df = ohlc_df.rename(columns={'high': 'high', 'low': 'low', 'close': 'close'})
     return temp_df.ta.atr(length=length, append=False)
 
+def ema_tail(values: np.ndarray, length: int) -> float:
+    """
+    Tail value of an exponential moving average, computed in closed form.
+
+    The recurrence ema_t = alpha*x_t + (1-alpha)*ema_{t-1} (seeded with
+    x_0) unrolls to a weighted sum
+        ema_{n-1} = d^(n-1)*x_0 + alpha * sum_{t>=1} d^(n-1-t)*x_t,  d = 1-alpha
+    which is one vectorized power plus a dot product instead of a serial
+    scalar loop. Matches ewm(span=length, adjust=False).mean().iloc[-1].
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.size
+    if n == 0:
+        return float('nan')
+    alpha = 2.0 / (length + 1.0)
+    pows = (1.0 - alpha) ** np.arange(n - 1, -1, -1)
+    return float(pows[0] * arr[0] + alpha * np.dot(pows[1:], arr[1:]))
+
+def incremental_atr(prev_atr: float, high: float, low: float, prev_close: float, length: int = 14) -> float:
+    """
+    Advances a Wilder-smoothed ATR by one bar without building the full
+    True Range Series. Only the newest bar's high/low and the previous
+    close are needed:
+        TR    = max(high - low, |high - prev_close|, |low - prev_close|)
+        ATR_t = (ATR_{t-1} * (length - 1) + TR) / length
+    Seed prev_atr from one calculate_atr() call, then this matches its
+    tail value at O(1) cost per bar.
+    """
+    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+    return (prev_atr * (length - 1) + tr) / length
+
 def calculate_rsi(ohlc_df: pd.DataFrame, length: int = 14, source_col: str = 'close') -> pd.Series:
     """Calculates Relative Strength Index (RSI)."""
     if ohlc_df is None or ohlc_df.empty or source_col not in ohlc_df.columns:
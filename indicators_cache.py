@@ -0,0 +1,48 @@
+"""
+Per-tick indicator sharing across strategies.
+
+When several strategies run against the same OHLC window they each ask
+for EMA/ATR tail values over identical periods (e.g. the four
+EMA20/ATR14 users), recomputing the full pandas-ta Series once per
+strategy. TickIndicators caches those scalars for one window so the
+ensemble pays for each computation once.
+"""
+from typing import Dict
+
+import pandas as pd
+
+from indicators import calculate_atr, ema_tail
+
+
+class TickIndicators:
+    """
+    Lazy per-tick cache of indicator tail values for one OHLC window.
+
+    The dispatcher builds one of these per tick and hands it to every
+    strategy via data['indicators'], so strategies asking for the same
+    period share one computation. Its lifetime is explicit: the object
+    is dropped together with the tick it was built for.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._ema: Dict[int, float] = {}
+        self._atr: Dict[int, float] = {}
+
+    def ema(self, period: int) -> float:
+        value = self._ema.get(period)
+        if value is None:
+            # Closed-form tail of the ewm(adjust=False) recurrence -- the
+            # same convention _TailState advances bar by bar, so seeding
+            # through this context or straight from the close array gives
+            # identical state (pandas-ta's ema would SMA-seed instead).
+            value = ema_tail(self.df['close'].to_numpy(copy=False), period)
+            self._ema[period] = value
+        return value
+
+    def atr(self, period: int) -> float:
+        value = self._atr.get(period)
+        if value is None:
+            value = float(calculate_atr(self.df, period).iloc[-1])
+            self._atr[period] = value
+        return value
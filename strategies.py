@@ -1,23 +1,197 @@
-from abc import ABC, abstractmethod
-from typing import Any, Dict
+import atexit
+import pickle
+from collections import deque
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+import numpy as np
 import pandas as pd
 from datetime import time
-from indicators import calculate_ema, calculate_atr
+from candles import Candles, datetime_index_ns
+from indicators import calculate_ema, calculate_atr, ema_tail, incremental_atr
+from indicators_cache import TickIndicators
+from strategies_kernels import band_kernel, safe_kernel, BUY, SELL, HOLD, HOLD_LOW_VOLUME
 
-class Strategy(ABC):
-    """Abstract base class for trading strategies."""
+_NS_PER_MINUTE = 60_000_000_000
+
+def session_mask(ns: np.ndarray, start_min: int, end_min: int) -> np.ndarray:
+    """
+    Boolean mask of bars whose minute-of-day lies in [start_min, end_min].
+
+    Works directly on int64 nanosecond timestamps: one vectorized
+    divide/modulo and two compares over the whole array instead of a
+    per-row Timestamp.time() call.
+    """
+    minutes = (ns // _NS_PER_MINUTE) % 1440
+    return (minutes >= start_min) & (minutes <= end_min)
+
+def _get_candles(data: Dict[str, Any]) -> Optional[Candles]:
+    """
+    Candle window for a decision, preferring the SoA feed the trader
+    maintains; falls back to converting the ohlc_1m DataFrame for
+    callers that only supply frames.
+    """
+    candles = data.get('candles_1m')
+    if candles is not None and len(candles) > 0:
+        return candles
+    df = data.get('ohlc_1m')
+    if df is None or len(df) == 0:
+        return None
+    return Candles.from_dataframe(df)
+
+class Decision(NamedTuple):
+    """
+    Immutable result of a strategy decision.
+
+    A NamedTuple instead of a per-tick dict: hold results (the common
+    path) can be shared constants, and downstream code reads fields by
+    attribute instead of hashed key lookups.
+    """
+    action: str
+    comment: str
+    sl_offset: Optional[float]
+    tp_offset: Optional[float]
+
+class _TailState:
+    """
+    Incremental last-bar indicator state shared by the strategies.
+
+    The strategies only ever read the final value of EMA/ATR/average volume,
+    so recomputing the full Series on every tick throws away N-1 values.
+    This helper seeds the recurrences once from a full calculate_ema /
+    calculate_atr pass, then advances them with O(1) scalar updates
+    (single-step EMA, Wilder ATR, rolling volume sum) whenever a new bar
+    appears in the OHLC history.
+    """
+
+    __slots__ = ('ema_period', 'atr_period', '_ema_prev', '_atr_prev',
+                 '_vols', '_volsum', '_last_ts')
+
+    def __init__(self, ema_period: int, atr_period: int):
+        self.ema_period = ema_period
+        self.atr_period = atr_period
+        self._ema_prev: Optional[float] = None
+        self._atr_prev: Optional[float] = None
+        self._vols: deque = deque(maxlen=atr_period)
+        self._volsum: float = 0.0
+        self._last_ts = None
+
+    def _push_vol(self, v: float) -> None:
+        if len(self._vols) == self._vols.maxlen:
+            self._volsum -= self._vols[0]
+        self._vols.append(v)
+        self._volsum += v
+
+    def _seed(self, candles: Candles, ind: Optional[TickIndicators]) -> None:
+        """One-time full-history pass to initialise the recurrences."""
+        if ind is not None:
+            self._ema_prev = ind.ema(self.ema_period)
+            self._atr_prev = ind.atr(self.atr_period)
+        else:
+            # EMA seeds straight from the close array in closed form (the
+            # same recurrence the per-bar step advances); ATR still needs
+            # a frame for the pandas-ta Wilder smoothing.
+            self._ema_prev = ema_tail(candles.close, self.ema_period)
+            self._atr_prev = float(calculate_atr(candles.to_dataframe(), self.atr_period).iloc[-1])
+        self._vols.clear()
+        self._volsum = 0.0
+        if candles.has_volume:
+            for v in candles.volume[-self.atr_period:]:
+                self._push_vol(float(v))
+
+    def save(self, path: str) -> None:
+        """Persist the warm state so a restart can skip the seeding pass."""
+        try:
+            with open(path, 'wb') as f:
+                pickle.dump({
+                    'ema_period': self.ema_period,
+                    'atr_period': self.atr_period,
+                    'ema_prev': self._ema_prev,
+                    'atr_prev': self._atr_prev,
+                    'vols': list(self._vols),
+                    'last_ts': self._last_ts,
+                }, f)
+        except OSError as e:
+            print(f"Warning: could not save strategy state to '{path}': {e}")
+
+    def load(self, path: str) -> bool:
+        """
+        Restore state written by save(). Returns True on success. State
+        saved for different periods is ignored, and update() reseeds on
+        its own if the feed has moved more than one bar since the saved
+        timestamp, so stale files cannot poison the recurrences.
+        """
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            print(f"Warning: could not load strategy state from '{path}': {e}")
+            return False
+        if (state.get('ema_period') != self.ema_period
+                or state.get('atr_period') != self.atr_period):
+            return False
+        self._ema_prev = state['ema_prev']
+        self._atr_prev = state['atr_prev']
+        self._vols.clear()
+        self._volsum = 0.0
+        for v in state['vols']:
+            self._push_vol(v)
+        self._last_ts = state['last_ts']
+        return True
+
+    def update(self, candles: Candles,
+               ind: Optional[TickIndicators] = None) -> Tuple[float, float, Optional[float]]:
+        """
+        Advance the state to the last bar and return (ema, atr, avg_vol).
+        avg_vol is None until a full volume window is available. An
+        optional TickIndicators shared across strategies is used for the
+        seed pass when it covers the same window.
+        """
+        if ind is not None and (ind.df is None or len(ind.df) != len(candles)):
+            ind = None
+        ts = int(candles.ts_ns[-1])
+
+        if self._ema_prev is None or self._last_ts is None or ts < self._last_ts:
+            # First call (or history was replaced/backfilled): full reseed.
+            self._seed(candles, ind)
+            self._last_ts = ts
+        elif ts != self._last_ts:
+            if len(candles) >= 2 and int(candles.ts_ns[-2]) != self._last_ts:
+                # Gap since the stored bar (e.g. warm state restored after
+                # downtime): a one-step recurrence would span several bars,
+                # so reseed from history instead.
+                self._seed(candles, ind)
+            else:
+                # New bar: single-step recurrences, no Series construction.
+                alpha = 2.0 / (self.ema_period + 1)
+                close_arr = candles.close
+                price = close_arr[-1]
+                self._ema_prev = alpha * price + (1.0 - alpha) * self._ema_prev
+                self._atr_prev = incremental_atr(
+                    self._atr_prev, candles.high[-1], candles.low[-1],
+                    close_arr[-2], self.atr_period)
+                if candles.has_volume:
+                    self._push_vol(float(candles.volume[-1]))
+            self._last_ts = ts
+        # Same bar as last call: cached values are already current.
+
+        avg_vol = None
+        if len(self._vols) == self._vols.maxlen:
+            avg_vol = self._volsum / len(self._vols)
+        return self._ema_prev, self._atr_prev, avg_vol
+
+class Strategy:
+    """
+    Base class for trading strategies. Concrete strategies override
+    decide() and get_required_bars(); plain methods (no ABC machinery)
+    and __slots__ keep the per-tick strategy.decide dispatch cheap.
+    """
+    __slots__ = ()
     NAME: str = "Base Strategy"
 
-    @abstractmethod
-    def decide(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            'action': 'hold',
-            'comment': f'{self.NAME} not implemented',
-            'sl_offset': None,
-            'tp_offset': None
-        }
+    def decide(self, data: Dict[str, Any]) -> Decision:
+        return Decision('hold', f'{self.NAME} not implemented', None, None)
 
-    @abstractmethod
     def get_required_bars(self) -> Dict[str, int]:
         """Returns a dict of {'timeframe_str': count} required by the strategy."""
         # Default implementation, subclasses should override if they have requirements.
@@ -33,6 +207,11 @@ class SafeStrategy(Strategy):
       - Trailing stop activation
     """
     NAME = "Safe (Low-Risk) Trend-Following Scalper"
+    __slots__ = ('settings', 'ema_period', 'atr_period', 'stop_mult',
+                 'target_mult', 'buffer_mult', 'volume_mult',
+                 'session_start', 'session_end', '_start_min', '_end_min',
+                 'trailing_activated', '_tail', '_state_path', '_min_bars',
+                 '_hold_decisions', '_buy_template', '_sell_template')
 
     def __init__(self,
                  settings,
@@ -43,237 +222,284 @@ class SafeStrategy(Strategy):
                  buffer_mult: float = 0.2,
                  volume_mult: float = 1.5,
                  session_start: time = time(8, 0),
-                 session_end: time = time(16, 0)):
+                 session_end: time = time(16, 0),
+                 state_path: Optional[str] = None):
         # Trend & volatility settings
         self.settings = settings
+        self._min_bars = settings.general.min_bars_for_trading
         self.ema_period = ema_period
         self.atr_period = atr_period
         self.stop_mult = stop_mult
         self.target_mult = target_mult
         self.buffer_mult = buffer_mult
         self.volume_mult = volume_mult
-        # Trading session window
+        # Trading session window, precomputed as minutes-of-day so the
+        # per-tick check is plain int64 arithmetic (no datetime.time objects)
         self.session_start = session_start
         self.session_end = session_end
+        self._start_min = session_start.hour * 60 + session_start.minute
+        self._end_min = session_end.hour * 60 + session_end.minute
         # Trailing stop state
         self.trailing_activated = False
+        # Incremental indicator state (seeded on first decide call).
+        # With a state_path the warm state survives restarts: it is
+        # loaded here and flushed at interpreter exit, skipping the
+        # one-time full-history seeding pass.
+        self._tail = _TailState(ema_period, atr_period)
+        self._state_path = state_path
+        if state_path:
+            self._tail.load(state_path)
+            atexit.register(self._tail.save, state_path)
+        # Pre-built hold Decisions so hold ticks (the common path) do a
+        # dict lookup and return a shared constant, allocating nothing
+        self._hold_decisions = {
+            reason: Decision('hold', f"{self.NAME}: {reason}", None, None)
+            for reason in ("insufficient data", "outside trading session",
+                           "low volume", "within buffer zone")
+        }
+        self._buy_template = f"{self.NAME}: price {{:.5f}} above EMA{ema_period} + buffer"
+        self._sell_template = f"{self.NAME}: price {{:.5f}} below EMA{ema_period} - buffer"
 
     def get_required_bars(self) -> Dict[str, int]:
         return {'1m': self.settings.general.min_bars_for_trading}
 
-    def in_session(self, timestamp: pd.Timestamp) -> bool:
-        t = timestamp.time()
-        return self.session_start <= t <= self.session_end
+    def in_session(self, ts_ns: int) -> bool:
+        minute = (ts_ns // _NS_PER_MINUTE) % 1440
+        return self._start_min <= minute <= self._end_min
 
-    def _hold(self, reason: str) -> Dict[str, Any]:
-        return {
-            'action': 'hold',
-            'comment': f"{self.NAME}: {reason}",
-            'sl_offset': None,
-            'tp_offset': None
-        }
+    def _hold(self, reason: str) -> Decision:
+        decision = self._hold_decisions.get(reason)
+        if decision is None:
+            decision = Decision('hold', f"{self.NAME}: {reason}", None, None)
+        return decision
 
-    def decide(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        df: pd.DataFrame = data.get('ohlc_1m')
+    def decide(self, data: Dict[str, Any]) -> Decision:
+        candles = _get_candles(data)
         # Startup check: require enough bars for EMA and ATR (removed +1 to activate at exact availability)
-        if df is None or len(df) < self.settings.general.min_bars_for_trading:
+        if candles is None or candles.n_bars < self._min_bars:
             return self._hold("insufficient data")
 
-        # Session filter
-        now = df.index[-1]
-        if not self.in_session(now):
+        # Session filter on the raw int64 nanosecond timestamp
+        if not self.in_session(int(candles.ts_ns[-1])):
             return self._hold("outside trading session")
 
-        close = df['close']
-        vol = df.get('volume', pd.Series(dtype=float))
-
-        ema = calculate_ema(close, self.ema_period).iloc[-1]
-        atr = calculate_atr(df, self.atr_period).iloc[-1]
-        price = close.iloc[-1]
-        avg_vol = None if vol.empty else vol.rolling(self.atr_period).mean().iloc[-1]
-
-        # Volume spike filter: require current volume ≥ multiplier × avg volume
-        if avg_vol and vol.iloc[-1] < avg_vol * self.volume_mult:
+        close_arr = candles.close
+
+        ema, atr, avg_vol = self._tail.update(candles, data.get('indicators'))
+        price = float(close_arr[-1])
+        prev_close = float(close_arr[-2])
+        vol_last = float(candles.volume[-1]) if candles.has_volume else -1.0
+
+        # All remaining decision arithmetic lives in the compiled kernel;
+        # avg_vol <= 0 disables the volume filter inside it.
+        action_code, sl, tp, trailing = safe_kernel(
+            price, prev_close, ema, atr, vol_last,
+            avg_vol if avg_vol is not None else -1.0,
+            self.buffer_mult, self.stop_mult, self.target_mult,
+            self.volume_mult, self.trailing_activated
+        )
+        just_activated = trailing and not self.trailing_activated
+        self.trailing_activated = bool(trailing)
+
+        if action_code == HOLD_LOW_VOLUME:
             return self._hold("low volume")
-
-        # Buffer zone around EMA to avoid whipsaws
-        buffer = atr * self.buffer_mult
-        if abs(price - ema) < buffer:
+        if action_code == HOLD:
             return self._hold("within buffer zone")
 
-        # Determine trade direction
-        if price > ema:
+        if action_code == BUY:
             action = 'buy'
-            comment = f"price {price:.5f} above EMA{self.ema_period} + buffer"
+            comment = self._buy_template.format(price)
         else:
             action = 'sell'
-            comment = f"price {price:.5f} below EMA{self.ema_period} - buffer"
-
-        # Base stop-loss and take-profit offsets
-        sl = atr * self.stop_mult
-        tp = atr * self.target_mult
-
-        # Activate trailing stop when price moves significantly beyond buffer
-        if not self.trailing_activated and (
-            (action == 'buy'  and price > ema + 2 * buffer) or
-            (action == 'sell' and price < ema - 2 * buffer)
-        ):
-            self.trailing_activated = True
+            comment = self._sell_template.format(price)
+        if just_activated:
             comment += "; trailing stop activated"
 
-        # If trailing stop is active, tighten the stop to breakeven + small offset
-        if self.trailing_activated:
-            breakeven_offset = atr * 0.1
-            prev_close = close.iloc[-2]
-            if action == 'buy':
-                sl = min(sl, price - (prev_close + breakeven_offset))
-            else:
-                sl = min(sl, (prev_close - breakeven_offset) - price)
+        return Decision(action, comment, sl, tp)
 
-        return {
-            'action': action,
-            'comment': f"{self.NAME}: {comment}",
-            'sl_offset': sl,
-            'tp_offset': tp
-        }
+    def decide_batch(self, df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized decide() over every bar of df for backtesting.
+
+        Instead of invoking decide() bar-by-bar in a Python loop, compute
+        full-length EMA/ATR/rolling-volume once and derive all signals in
+        a single numpy pass. Returns (action, sl_offset, tp_offset)
+        arrays, with action coded as in strategies_kernels (0=hold,
+        1=buy, 2=sell). Bars outside the session or failing the volume
+        filter are forced to hold; the stateful trailing-stop adjustment
+        is a live-only refinement and is not modelled here.
+        """
+        if df is None or len(df) < self.settings.general.min_bars_for_trading:
+            empty = np.empty(0)
+            return empty.astype(np.int8), empty, empty
+
+        close = df['close'].to_numpy(copy=False)
+        ema = calculate_ema(df, self.ema_period).to_numpy()
+        atr = calculate_atr(df, self.atr_period).to_numpy()
+        buffer = atr * self.buffer_mult
+
+        action = np.where(close > ema + buffer, BUY,
+                          np.where(close < ema - buffer, SELL, HOLD)).astype(np.int8)
+
+        # Session mask on the raw int64 nanosecond timestamps
+        if 'timestamp' in df.columns:
+            ns = df['timestamp'].to_numpy(copy=False).astype('datetime64[ns]', copy=False).view('i8')
+        else:
+            ns = datetime_index_ns(df.index)
+        ok = session_mask(ns, self._start_min, self._end_min)
+
+        # Volume spike mask. The rolling mean comes from a cumulative-sum
+        # difference instead of pandas rolling; bars without a full
+        # window stay NaN, compare False and therefore pass the filter.
+        if 'volume' in df.columns:
+            vol_arr = df['volume'].to_numpy(copy=False).astype(np.float64, copy=False)
+            n = self.atr_period
+            csum = np.cumsum(vol_arr)
+            avg_vol = np.full(vol_arr.shape, np.nan)
+            avg_vol[n - 1:] = (csum[n - 1:] - np.concatenate(([0.0], csum[:-n]))) / n
+            ok &= ~(vol_arr < avg_vol * self.volume_mult)
+
+        action = np.where(ok, action, HOLD).astype(np.int8)
+        return action, atr * self.stop_mult, atr * self.target_mult
 
 class ModerateStrategy(Strategy):
     NAME = "Moderate Trend-Following Scalper"
+    __slots__ = ('settings', 'ema_period', 'atr_period', '_min_bars',
+                 'stop_multiplier', 'target_multiplier', '_tail')
+    _HOLD_INSUFFICIENT = Decision('hold', f'{NAME}: insufficient data', None, None)
+    _HOLD_NO_SIGNAL = Decision('hold', f'{NAME}: no clear trend', None, None)
     def __init__(self, settings):
         self.settings = settings
+        self._min_bars = settings.general.min_bars_for_trading
         self.ema_period = 20
         self.atr_period = 14
         self.stop_multiplier = 1.5
         self.target_multiplier = 1.0
+        self._tail = _TailState(self.ema_period, self.atr_period)
 
     def get_required_bars(self) -> Dict[str, int]:
         return {'1m': self.settings.general.min_bars_for_trading}
 
-    def decide(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        df: pd.DataFrame = data.get('ohlc_1m')
-        if df is None or len(df) < self.settings.general.min_bars_for_trading:
-            return {'action': 'hold', 'comment': f'{self.NAME}: insufficient data', 'sl_offset': None, 'tp_offset': None}
+    def decide(self, data: Dict[str, Any]) -> Decision:
+        candles = _get_candles(data)
+        if candles is None or candles.n_bars < self._min_bars:
+            return self._HOLD_INSUFFICIENT
 
-        ema = calculate_ema(df['close'], self.ema_period).iloc[-1]
-        atr = calculate_atr(df, self.atr_period).iloc[-1]
-        price = df['close'].iloc[-1]
+        ema, atr, _ = self._tail.update(candles, data.get('indicators'))
+        price = float(candles.close[-1])
 
-        if price > ema:
-            action = 'buy'
-            comment = f'{self.NAME}: bullish trend detected'
-        elif price < ema:
-            action = 'sell'
-            comment = f'{self.NAME}: bearish trend detected'
-        else:
-            return {'action': 'hold', 'comment': f'{self.NAME}: no clear trend', 'sl_offset': None, 'tp_offset': None}
-
-        sl_offset = atr * self.stop_multiplier
-        tp_offset = atr * self.target_multiplier
-        return {'action': action, 'comment': comment, 'sl_offset': sl_offset, 'tp_offset': tp_offset}
+        action_code, sl, tp = band_kernel(
+            price, ema, atr, 0.0, False,
+            self.stop_multiplier, self.target_multiplier)
+        if action_code == HOLD:
+            return self._HOLD_NO_SIGNAL
+        if action_code == BUY:
+            return Decision('buy', f'{self.NAME}: bullish trend detected', sl, tp)
+        return Decision('sell', f'{self.NAME}: bearish trend detected', sl, tp)
 
 class AggressiveStrategy(Strategy):
     NAME = "Aggressive Trend-Following Scalper"
+    __slots__ = ('settings', 'ema_period', 'atr_period', '_min_bars',
+                 'stop_multiplier', 'target_multiplier', '_tail')
+    _HOLD_INSUFFICIENT = Decision('hold', f'{NAME}: insufficient data', None, None)
+    _HOLD_NO_SIGNAL = Decision('hold', f'{NAME}: awaiting breakout', None, None)
     def __init__(self, settings):
         self.settings = settings
+        self._min_bars = settings.general.min_bars_for_trading
         self.ema_period = 10
         self.atr_period = 7
         self.stop_multiplier = 2.0
         self.target_multiplier = 1.5
+        self._tail = _TailState(self.ema_period, self.atr_period)
 
     def get_required_bars(self) -> Dict[str, int]:
         return {'1m': self.settings.general.min_bars_for_trading}
 
-    def decide(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        df: pd.DataFrame = data.get('ohlc_1m')
-        if df is None or len(df) < self.settings.general.min_bars_for_trading:
-            return {'action': 'hold', 'comment': f'{self.NAME}: insufficient data', 'sl_offset': None, 'tp_offset': None}
-
-        ema = calculate_ema(df['close'], self.ema_period).iloc[-1]
-        atr = calculate_atr(df, self.atr_period).iloc[-1]
-        price = df['close'].iloc[-1]
+    def decide(self, data: Dict[str, Any]) -> Decision:
+        candles = _get_candles(data)
+        if candles is None or candles.n_bars < self._min_bars:
+            return self._HOLD_INSUFFICIENT
 
-        if price > ema:
-            action = 'buy'
-            comment = f'{self.NAME}: going long aggressively'
-        elif price < ema:
-            action = 'sell'
-            comment = f'{self.NAME}: going short aggressively'
-        else:
-            return {'action': 'hold', 'comment': f'{self.NAME}: awaiting breakout', 'sl_offset': None, 'tp_offset': None}
+        ema, atr, _ = self._tail.update(candles, data.get('indicators'))
+        price = float(candles.close[-1])
 
-        sl_offset = atr * self.stop_multiplier
-        tp_offset = atr * self.target_multiplier
-        return {'action': action, 'comment': comment, 'sl_offset': sl_offset, 'tp_offset': tp_offset}
+        action_code, sl, tp = band_kernel(
+            price, ema, atr, 0.0, False,
+            self.stop_multiplier, self.target_multiplier)
+        if action_code == HOLD:
+            return self._HOLD_NO_SIGNAL
+        if action_code == BUY:
+            return Decision('buy', f'{self.NAME}: going long aggressively', sl, tp)
+        return Decision('sell', f'{self.NAME}: going short aggressively', sl, tp)
 
 class MomentumStrategy(Strategy):
     NAME = "Momentum Fade Scalper"
+    __slots__ = ('settings', 'ema_period', 'atr_period', 'fade_threshold', '_min_bars',
+                 'stop_multiplier', 'target_multiplier', '_tail')
+    _HOLD_INSUFFICIENT = Decision('hold', f'{NAME}: insufficient data', None, None)
+    _HOLD_NO_SIGNAL = Decision('hold', f'{NAME}: no fade opportunity', None, None)
     def __init__(self, settings):
         self.settings = settings
+        self._min_bars = settings.general.min_bars_for_trading
         self.ema_period = 20
         self.atr_period = 14
         self.fade_threshold = 1.5  # ATR multiples
         self.stop_multiplier = 1.0
         self.target_multiplier = 1.5
+        self._tail = _TailState(self.ema_period, self.atr_period)
 
     def get_required_bars(self) -> Dict[str, int]:
         return {'1m': self.settings.general.min_bars_for_trading}
 
-    def decide(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        df: pd.DataFrame = data.get('ohlc_1m')
-        if df is None or len(df) < self.settings.general.min_bars_for_trading:
-            return {'action': 'hold', 'comment': f'{self.NAME}: insufficient data', 'sl_offset': None, 'tp_offset': None}
-
-        ema = calculate_ema(df['close'], self.ema_period).iloc[-1]
-        atr = calculate_atr(df, self.atr_period).iloc[-1]
-        price = df['close'].iloc[-1]
-        diff = price - ema
+    def decide(self, data: Dict[str, Any]) -> Decision:
+        candles = _get_candles(data)
+        if candles is None or candles.n_bars < self._min_bars:
+            return self._HOLD_INSUFFICIENT
 
-        if diff > atr * self.fade_threshold:
-            action = 'sell'
-            comment = f'{self.NAME}: fading overextension'
-        elif diff < -atr * self.fade_threshold:
-            action = 'buy'
-            comment = f'{self.NAME}: fading downside spike'
-        else:
-            return {'action': 'hold', 'comment': f'{self.NAME}: no fade opportunity', 'sl_offset': None, 'tp_offset': None}
+        ema, atr, _ = self._tail.update(candles, data.get('indicators'))
+        price = float(candles.close[-1])
 
-        sl_offset = atr * self.stop_multiplier
-        tp_offset = atr * self.target_multiplier
-        return {'action': action, 'comment': comment, 'sl_offset': sl_offset, 'tp_offset': tp_offset}
+        action_code, sl, tp = band_kernel(
+            price, ema, atr, self.fade_threshold, True,
+            self.stop_multiplier, self.target_multiplier)
+        if action_code == HOLD:
+            return self._HOLD_NO_SIGNAL
+        if action_code == BUY:
+            return Decision('buy', f'{self.NAME}: fading downside spike', sl, tp)
+        return Decision('sell', f'{self.NAME}: fading overextension', sl, tp)
 
 class MeanReversionStrategy(Strategy):
     NAME = "Mean-Reversion Scalper"
+    __slots__ = ('settings', 'ema_period', 'atr_period', 'band_multiplier', '_min_bars',
+                 'stop_multiplier', 'target_multiplier', '_tail')
+    _HOLD_INSUFFICIENT = Decision('hold', f'{NAME}: insufficient data', None, None)
+    _HOLD_NO_SIGNAL = Decision('hold', f'{NAME}: within bands', None, None)
     def __init__(self, settings):
         self.settings = settings
+        self._min_bars = settings.general.min_bars_for_trading
         self.ema_period = 20
         self.atr_period = 14
         self.band_multiplier = 2.0  # ATR multiples
         self.stop_multiplier = 1.0
         self.target_multiplier = 2.0
+        self._tail = _TailState(self.ema_period, self.atr_period)
 
     def get_required_bars(self) -> Dict[str, int]:
         return {'1m': self.settings.general.min_bars_for_trading}
 
-    def decide(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        df: pd.DataFrame = data.get('ohlc_1m')
-        if df is None or len(df) < self.settings.general.min_bars_for_trading:
-            return {'action': 'hold', 'comment': f'{self.NAME}: insufficient data', 'sl_offset': None, 'tp_offset': None}
-
-        ema = calculate_ema(df['close'], self.ema_period).iloc[-1]
-        atr = calculate_atr(df, self.atr_period).iloc[-1]
-        price = df['close'].iloc[-1]
-        upper = ema + atr * self.band_multiplier
-        lower = ema - atr * self.band_multiplier
-
-        if price > upper:
-            action = 'sell'
-            comment = f'{self.NAME}: price above upper band'
-        elif price < lower:
-            action = 'buy'
-            comment = f'{self.NAME}: price below lower band'
-        else:
-            return {'action': 'hold', 'comment': f'{self.NAME}: within bands', 'sl_offset': None, 'tp_offset': None}
-
-        sl_offset = atr * self.stop_multiplier
-        tp_offset = atr * self.target_multiplier
-        return {'action': action, 'comment': comment, 'sl_offset': sl_offset, 'tp_offset': tp_offset}
+    def decide(self, data: Dict[str, Any]) -> Decision:
+        candles = _get_candles(data)
+        if candles is None or candles.n_bars < self._min_bars:
+            return self._HOLD_INSUFFICIENT
+
+        ema, atr, _ = self._tail.update(candles, data.get('indicators'))
+        price = float(candles.close[-1])
+
+        action_code, sl, tp = band_kernel(
+            price, ema, atr, self.band_multiplier, True,
+            self.stop_multiplier, self.target_multiplier)
+        if action_code == HOLD:
+            return self._HOLD_NO_SIGNAL
+        if action_code == BUY:
+            return Decision('buy', f'{self.NAME}: price below lower band', sl, tp)
+        return Decision('sell', f'{self.NAME}: price above upper band', sl, tp)
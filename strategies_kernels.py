@@ -0,0 +1,107 @@
+"""
+Numba-compiled hot kernels for the trading strategies.
+
+The decision arithmetic in the strategies is a short numeric routine
+(compare to EMA, buffer check, trailing-stop logic) that gets called on
+every tick, so it is worth JIT-compiling. numba is an optional
+dependency: when it is not installed, `njit` below degrades to a no-op
+decorator and the same functions run as plain Python with identical
+behaviour.
+"""
+from math import fabs
+from typing import Tuple
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba not installed: run the kernels as plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+# Action codes returned by the kernels (kept as ints so the kernels stay
+# string-free; strategies map them back to 'buy'/'sell'/'hold' comments).
+HOLD = 0
+BUY = 1
+SELL = 2
+HOLD_LOW_VOLUME = 3
+
+
+@njit(cache=True)
+def band_kernel(price: float,
+                ema: float,
+                atr: float,
+                band_mult: float,
+                fade: bool,
+                stop_mult: float,
+                target_mult: float) -> Tuple[int, float, float]:
+    """
+    Shared decision arithmetic for the band-style strategies.
+
+    Compares price to an ATR band around the EMA. With fade=False a move
+    above/below the band means buy/sell (trend-following; band_mult 0.0
+    compares straight to the EMA). With fade=True the signal is inverted
+    (momentum fade / mean reversion). Returns (action_code, sl_offset,
+    tp_offset).
+    """
+    band = atr * band_mult
+    if price > ema + band:
+        action = SELL if fade else BUY
+    elif price < ema - band:
+        action = BUY if fade else SELL
+    else:
+        return HOLD, 0.0, 0.0
+    return action, atr * stop_mult, atr * target_mult
+
+
+@njit(cache=True)
+def safe_kernel(price: float,
+                prev_close: float,
+                ema: float,
+                atr: float,
+                vol_last: float,
+                avg_vol: float,
+                buffer_mult: float,
+                stop_mult: float,
+                target_mult: float,
+                volume_mult: float,
+                trailing_activated: bool) -> Tuple[int, float, float, bool]:
+    """
+    SafeStrategy decision arithmetic on plain scalars.
+
+    avg_vol <= 0 means "no volume information" (filter disabled).
+    Returns (action_code, sl_offset, tp_offset, trailing_activated).
+    """
+    # Volume spike filter: require current volume >= multiplier x avg volume
+    if avg_vol > 0.0 and vol_last < avg_vol * volume_mult:
+        return HOLD_LOW_VOLUME, 0.0, 0.0, trailing_activated
+
+    # Buffer zone around EMA to avoid whipsaws
+    buffer = atr * buffer_mult
+    diff = price - ema
+    if fabs(diff) < buffer:
+        return HOLD, 0.0, 0.0, trailing_activated
+
+    # sgn folds the buy/sell branches of the trailing logic into one
+    # arithmetic form: sgn*(price - x) measures movement in trade direction
+    action = BUY if diff > 0.0 else SELL
+    sgn = 1.0 if diff > 0.0 else -1.0
+
+    # Base stop-loss and take-profit offsets
+    sl = atr * stop_mult
+    tp = atr * target_mult
+
+    # Activate trailing stop when price moves significantly beyond buffer
+    if not trailing_activated and sgn * diff > 2.0 * buffer:
+        trailing_activated = True
+
+    # If trailing stop is active, tighten the stop to breakeven + small offset
+    if trailing_activated:
+        sl = min(sl, sgn * (price - prev_close) - atr * 0.1)
+
+    return action, sl, tp, trailing_activated
@@ -0,0 +1,101 @@
+"""
+Tests for the strategy kernels and candle storage.
+
+Runnable with pytest, or directly: python test_strategies_kernels.py
+Deliberately imports only strategies_kernels and candles so it runs
+without the trading/GUI dependencies installed.
+"""
+import numpy as np
+
+from candles import Candles
+from strategies_kernels import safe_kernel, BUY, SELL, HOLD, HOLD_LOW_VOLUME
+
+
+def _reference_safe_kernel(price, prev_close, ema, atr, vol_last, avg_vol,
+                           buffer_mult, stop_mult, target_mult, volume_mult,
+                           trailing_activated):
+    """
+    The original branchy form of safe_kernel, kept as the oracle for the
+    sign-multiplier (branchless) trailing-stop rewrite.
+    """
+    if avg_vol > 0.0 and vol_last < avg_vol * volume_mult:
+        return HOLD_LOW_VOLUME, 0.0, 0.0, trailing_activated
+
+    buffer = atr * buffer_mult
+    if abs(price - ema) < buffer:
+        return HOLD, 0.0, 0.0, trailing_activated
+
+    action = BUY if price > ema else SELL
+    sl = atr * stop_mult
+    tp = atr * target_mult
+
+    if not trailing_activated and (
+        (action == BUY and price > ema + 2.0 * buffer) or
+        (action == SELL and price < ema - 2.0 * buffer)
+    ):
+        trailing_activated = True
+
+    if trailing_activated:
+        breakeven_offset = atr * 0.1
+        if action == BUY:
+            sl = min(sl, price - (prev_close + breakeven_offset))
+        else:
+            sl = min(sl, (prev_close - breakeven_offset) - price)
+
+    return action, sl, tp, trailing_activated
+
+
+def test_safe_kernel_matches_branchy_reference():
+    """The branchless trailing rewrite must agree with the original
+    two-branch form over randomized inputs (action/flag exactly, the
+    float offsets to well under a micro-pip)."""
+    rng = np.random.default_rng(1234)
+    for _ in range(50000):
+        args = (
+            float(rng.normal(1.1, 0.01)),     # price
+            float(rng.normal(1.1, 0.01)),     # prev_close
+            float(rng.normal(1.1, 0.01)),     # ema
+            float(rng.uniform(1e-5, 1e-2)),   # atr
+            float(rng.uniform(-1.0, 60.0)),   # vol_last
+            float(rng.uniform(-1.0, 60.0)),   # avg_vol (<=0 disables filter)
+            0.2, 1.0, 0.5, 1.5,               # multipliers (SafeStrategy defaults)
+            bool(rng.integers(2)),            # trailing_activated
+        )
+        got = safe_kernel(*args)
+        want = _reference_safe_kernel(*args)
+        assert got[0] == want[0], (args, got, want)
+        assert got[3] == want[3], (args, got, want)
+        # sgn*(price - prev_close) - off regroups the additions of the
+        # branchy form, so allow last-ulp rounding differences
+        assert abs(got[1] - want[1]) < 1e-12, (args, got, want)
+        assert abs(got[2] - want[2]) < 1e-12, (args, got, want)
+
+
+def test_candles_float32_within_fx_tolerance():
+    """float32 candle storage must round-trip O(1) FX prices well inside
+    a pip (rtol 1e-5), per the quantization change."""
+    rng = np.random.default_rng(99)
+    n = 500
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n))
+    high = close + rng.uniform(1e-4, 4e-4, n)
+    low = close - rng.uniform(1e-4, 4e-4, n)
+    vol = rng.integers(1, 1000, n).astype(np.float64)
+
+    candles = Candles(n)
+    t0 = 1_677_664_800_000_000_000  # arbitrary ns epoch
+    for i in range(n):
+        candles.append(t0 + i * 60_000_000_000, close[i], high[i], low[i],
+                       close[i], vol[i])
+
+    assert np.allclose(candles.close, close, rtol=1e-5, atol=0.0)
+    assert np.allclose(candles.high, high, rtol=1e-5, atol=0.0)
+    assert np.allclose(candles.low, low, rtol=1e-5, atol=0.0)
+    assert np.allclose(candles.volume, vol, rtol=1e-5, atol=0.0)
+    # timestamps must stay exact int64 nanoseconds
+    assert candles.ts_ns[-1] == t0 + (n - 1) * 60_000_000_000
+
+
+if __name__ == '__main__':
+    test_safe_kernel_matches_branchy_reference()
+    test_candles_float32_within_fx_tolerance()
+    print("All kernel tests passed.")
@@ -14,6 +14,8 @@ import traceback
 import pandas as pd
 from datetime import datetime, timezone
 
+from candles import Candles
+
 # Conditional import for Twisted reactor for GUI integration
 _reactor_installed = False
 try:
@@ -134,6 +136,7 @@ class Trader:
         }
         self.current_bars = {} # Stores the currently forming bar for each timeframe
         self.ohlc_history = {} # Stores history of completed bars for each timeframe
+        self.candles = {} # SoA mirror of ohlc_history for the strategy hot path
         self.max_ohlc_history_len = 500 # Max number of OHLC bars to keep per timeframe
 
         for tf_str in self.timeframes_seconds.keys():
@@ -148,6 +151,7 @@ class Trader:
             self.ohlc_history[tf_str] = pd.DataFrame(
                 columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
             )
+            self.candles[tf_str] = Candles(self.max_ohlc_history_len)
 
 
         # Initialize token fields before loading
@@ -873,6 +877,16 @@ class Trader:
                             if len(self.ohlc_history[tf_str]) > self.max_ohlc_history_len:
                                 self.ohlc_history[tf_str] = self.ohlc_history[tf_str].iloc[-self.max_ohlc_history_len:]
 
+                            # Mirror the completed bar into the SoA buffer
+                            self.candles[tf_str].append(
+                                completed_bar_data['timestamp'],
+                                completed_bar_data['open'],
+                                completed_bar_data['high'],
+                                completed_bar_data['low'],
+                                completed_bar_data['close'],
+                                completed_bar_data['volume']
+                            )
+
                             # Optional: Log completed bar
                             # print(f"Completed {tf_str} bar: O={completed_bar_data['open']:.5f} H={completed_bar_data['high']:.5f} L={completed_bar_data['low']:.5f} C={completed_bar_data['close']:.5f} V={completed_bar_data['volume']}")
 
@@ -1902,6 +1916,7 @@ class Trader:
         # For simplicity, we'll overwrite if called again, assuming this is for initial fill.
         # A more complex merge could be done if fetching partial history later.
         self.ohlc_history[tf_str] = new_df
+        self.candles[tf_str] = Candles.from_dataframe(new_df, self.max_ohlc_history_len)
         print(f"Populated {tf_str} OHLC history with {len(new_df)} bars for symbol ID {symbol_id}. Last bar timestamp: {new_df.iloc[-1]['timestamp'] if not new_df.empty else 'N/A'}")
 
         # After populating, we might need to adjust self.current_bars[tf_str]